@@ -1,48 +1,104 @@
+import concurrent.futures
+import functools
 import os
 import requests
 import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from io import BytesIO
+from suds.cache import ObjectCache
 from suds.client import Client
 from suds.transport.http import HttpAuthenticated
 from suds.transport import Reply
-from typing import Union
+from typing import Optional, Union
 
-if 'komle.bindings.v1411.write' in sys.modules:
-    # Witsml uses the same namespace for each schema
-    # So for now check what binding is in use
-    from komle.bindings.v1411.write import witsml
-else:
-    # Default to import read_bindings
-    from komle.bindings.v1411.read import witsml
+_witsml_module = None
+
+def _witsml():
+    '''Import the witsml bindings on first use,
+
+    The pyxb generated modules are large, so deferring the import keeps
+    startup fast and memory low for callers that never touch the store.
+    '''
+    global _witsml_module
+
+    if _witsml_module is None:
+        if 'komle.bindings.v1411.write' in sys.modules:
+            # Witsml uses the same namespace for each schema
+            # So for now check what binding is in use
+            from komle.bindings.v1411.write import witsml
+        else:
+            # Default to import read_bindings
+            from komle.bindings.v1411.read import witsml
+
+        _witsml_module = witsml
+
+    return _witsml_module
 
 class RequestsTransport(HttpAuthenticated):
     def __init__(self, **kwargs):
         self.verify = kwargs.pop('verify', None)
         self.auth = (kwargs.pop('username', None), kwargs.pop('password', None))
+        agent_name = kwargs.pop('agent_name', 'komle')
+        # Reuse one session so keep-alive connections survive across calls,
+        # instead of a new TCP+TLS handshake per WMLS request
+        self.session = requests.Session()
+        self._pool_maxsize = 10
+        adapter = requests.adapters.HTTPAdapter(pool_connections=10,
+                                                pool_maxsize=self._pool_maxsize)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({'User-Agent': agent_name})
         HttpAuthenticated.__init__(self, **kwargs)
 
+    def ensure_pool_size(self, size: int):
+        '''Grow the connection pool so concurrent calls do not block on it'''
+        if size > self._pool_maxsize:
+            adapter = requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=size)
+            self.session.mount('http://', adapter)
+            self.session.mount('https://', adapter)
+            self._pool_maxsize = size
+
     def send(self, request):
-        resp = requests.post(
+        resp = self.session.post(
             request.url,
             data=request.message,
             headers=request.headers,
             verify=self.verify,
             auth=self.auth,
+            stream=True,
         )
-        resp.raise_for_status()
-        result = Reply(resp.status_code, resp.headers, resp.content)
+        # Witsml servers return soap faults as xml in the http 500 body,
+        # hand those to suds for a proper fault instead of raising here
+        if resp.status_code >= 400 and 'xml' not in resp.headers.get('Content-Type', ''):
+            resp.raise_for_status()
+        # suds needs the full envelope, but reading raw in one go avoids
+        # the extra chunk-join copy requests makes for resp.content
+        result = Reply(resp.status_code, resp.headers, resp.raw.read(decode_content=True))
         return result
 
+    def close(self):
+        self.session.close()
+
+_SUDS_CACHE_LOCATION = os.path.join(tempfile.gettempdir(), 'komle-suds')
+
 def simple_client(service_url: str, username: str, password: str,
                   agent_name: str='komle', verify: Union[bool,str]=True) -> Client:
-    '''Create a simple soap client using Suds, 
-    
+    '''Create a simple soap client using Suds,
+
     This initializes the client with a local version of WMLS.WSDL 1.4 from energistics.
+    The parsed wsdl object graph is kept in suds' on-disk ObjectCache, so repeat
+    client constructions skip the wsdl parsing and schema resolution. Soap faults
+    are returned on the reply (faults=False) instead of raised, so the store reply
+    can be inspected.
 
     Args:
         service_url (str): url giving the location of the Store
         username (str): username on the service
         password (str): password on the service
-        agent_name (str): User-Agent name to pass in header 
+        agent_name (str): User-Agent name to pass in header
         verify (bool|str): Whether to verify TLS certificates, or path to a cacerts file
 
     Returns:
@@ -51,55 +107,354 @@ def simple_client(service_url: str, username: str, password: str,
 
     transport = RequestsTransport(username=username,
                                   password=password,
-                                  verify=verify)
+                                  verify=verify,
+                                  agent_name=agent_name)
 
-    client = Client(f'file:{os.path.join(os.path.dirname(__file__), "WMLS.WSDL")}', 
-                    location=service_url)
+    client = Client(f'file:{os.path.join(os.path.dirname(__file__), "WMLS.WSDL")}',
+                    location=service_url,
+                    cache=ObjectCache(location=_SUDS_CACHE_LOCATION, days=30),
+                    cachingpolicy=1,
+                    faults=False)
 
     client.set_options(transport=transport, headers={'User-Agent':agent_name})
 
     return client
 
+_WITSML_NAMESPACE = 'http://www.witsml.org/schemas/1series'
+
+# The legal returnElements values in the WITSML 1.4.1.1 api, precomputed
+# so the hot path reuses the OptionsIn strings instead of rebuilding them
+_OPTIONS_IN = {v: f'returnElements={v}' for v in ('all',
+                                                  'id-only',
+                                                  'header-only',
+                                                  'data-only',
+                                                  'station-location-only',
+                                                  'latest-change-only',
+                                                  'requested')}
+
+def _is_empty_query(q_obj) -> bool:
+    '''True if no elements or attributes are set on the query object
+
+    Values appended directly to a plural element field, like
+    q_log.logCurveInfo.append(...), do not show up in orderedContent()
+    even though toxml() serializes them, so element content is checked
+    through _symbolSet() as well.
+    '''
+    return (not q_obj._symbolSet()
+            and not q_obj.orderedContent()
+            and not any(au.provided(q_obj) for au in q_obj._AttributeMap.values()))
+
+@functools.lru_cache(maxsize=1)
+def _wrappers():
+    '''The WITSML API mandated plural root element per singular object type,
+
+    The plural name is always the singular name plus an s. Built lazily
+    since it pulls in the witsml bindings.
+    '''
+    witsml = _witsml()
+
+    return {'bhaRun': witsml.bhaRuns,
+            'log': witsml.logs,
+            'mudLog': witsml.mudLogs,
+            'trajectory': witsml.trajectorys,
+            'wellbore': witsml.wellbores,
+            'tubular': witsml.tubulars,
+            'fluidsReport': witsml.fluidsReports,
+            'drillReport': witsml.drillReports,
+            'wbGeometry': witsml.wbGeometrys,
+            'formationMarker': witsml.formationMarkers}
+
+@functools.lru_cache(maxsize=None)
+def _empty_query_xml(obj_type: str) -> str:
+    return (f'<{obj_type}s version="{_witsml().__version__}" xmlns="{_WITSML_NAMESPACE}">'
+            f'<{obj_type}/></{obj_type}s>')
+
+@functools.lru_cache(maxsize=None)
+def _wrapper_prototype(obj_type: str):
+    return _wrappers()[obj_type](version=_witsml().__version__)
+
+# The prototypes hold shared content state, so reuse is serialized
+_prototype_lock = threading.Lock()
+
+def _build_query_xml(q_obj, obj_type: str) -> str:
+    '''Serialize a query object to the XMLin string for WMLS_GetFromStore
+
+    Empty queries, like get all by id, are served from a precomputed xml
+    template so the pyxb wrapper construction and serialization is skipped.
+    Non-empty queries reuse one prototype wrapper instance per object
+    type, reset between calls, instead of paying the pyxb complex-type
+    construction on every request.
+    '''
+    if _is_empty_query(q_obj):
+        return _empty_query_xml(obj_type)
+
+    with _prototype_lock:
+        q_plural = _wrapper_prototype(obj_type)
+        q_plural.reset()
+        q_plural.version = _witsml().__version__
+        q_plural.append(q_obj)
+        return q_plural.toxml()
+
 class StoreException(Exception):
     def __init__(self, reply):
-        super().__init__(f'{reply.Result}: {reply.SuppMsgOut}')
+        super().__init__(f'{getattr(reply, "Result", "fault")}: '
+                         f'{getattr(reply, "SuppMsgOut", reply)}')
         self.reply = reply
 
-def _parse_reply(reply):
-    if reply.Result == 1:
-        '''Function Completed Successfully'''
-        return witsml.CreateFromDocument(reply.XMLout)
-    elif reply.Result == 2:
-        '''<!-- Partial success: Function completed successfully but some growing data-object data-nodes were not returned. -->
-            Function completed successfully but some growing object data-nodes were not returned.'''
-        return witsml.CreateFromDocument(reply.XMLout)
-    else:
+class WitsmlElement:
+    '''Lightweight element from the lxml fast path
+
+    Child elements are reached as attributes, a repeated child comes back
+    as a list, and xml attributes like uid and uom are reached as
+    attributes or through _attrib. The element text is on _text. The own
+    api is underscore prefixed so witsml element names, for example the
+    value child of extensionNameValue, can never collide with it.
+
+    Unlike the pyxb bindings no schema validation is done, and a plural
+    element that happens to occur once is returned singular.
+    '''
+
+    __slots__ = ('_tag', '_text', '_attrib', '_children')
+
+    def __init__(self, tag: str, text: Optional[str]=None,
+                 attrib: Optional[dict]=None, children: Optional[list]=None):
+        self._tag = tag
+        self._text = text
+        self._attrib = attrib if attrib is not None else {}
+        self._children = children if children is not None else []
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        matches = [c for c in self._children if c._tag == name]
+        if matches:
+            return matches if len(matches) > 1 else matches[0]
+        if name in self._attrib:
+            return self._attrib[name]
+        raise AttributeError(name)
+
+    def __repr__(self):
+        return f'WitsmlElement({self._tag})'
+
+def _parse_reply_lxml(source) -> WitsmlElement:
+    '''Parse XMLout with lxml into WitsmlElement objects,
+
+    Avoids pyxb's pure python dom parse and validation, which dominates
+    both time and memory on large log and trajectory replies.
+
+    The source can be a str, bytes or a file-like and is streamed through
+    iterparse, with each processed element cleared along the way so peak
+    memory stays flat on multi-MB replies.
+    '''
+    from lxml import etree
+
+    if isinstance(source, str):
+        source = BytesIO(source.encode('utf-8'))
+    elif isinstance(source, (bytes, bytearray)):
+        source = BytesIO(source)
+
+    root = None
+    stack = []
+
+    for event, elem in etree.iterparse(source, events=('start', 'end'), huge_tree=True):
+        if event == 'start':
+            node = WitsmlElement(elem.tag.split('}')[-1], attrib=dict(elem.attrib))
+            if stack:
+                stack[-1]._children.append(node)
+            else:
+                root = node
+            stack.append(node)
+        else:
+            stack.pop()._text = elem.text
+            elem.clear()
+            # drop the reference the parent keeps to the cleared element
+            parent = elem.getparent()
+            if parent is not None:
+                while elem.getprevious() is not None:
+                    del parent[0]
+
+    return root
+
+def _parse_reply(reply, validate: bool=True):
+    # Result 1: Function Completed Successfully
+    # Result 2: Function completed successfully but some growing object data-nodes were not returned
+    if getattr(reply, 'Result', None) not in (1, 2):
         raise StoreException(reply)
 
+    if validate:
+        return _witsml().CreateFromDocument(reply.XMLout)
+    else:
+        return _parse_reply_lxml(reply.XMLout)
+
 class StoreClient:
     def __init__(self, service_url: str, username: str, password: str,
-                 agent_name: str='komle', verify: Union[bool,str]=True):
-        '''Create a GetFromStore client, 
-        
+                 agent_name: str='komle', verify: Union[bool,str]=True,
+                 validate: bool=True, cache_maxsize: int=0,
+                 cache_ttl: Optional[float]=None):
+        '''Create a GetFromStore client,
+
         This initializes the client with a local version of WMLS.WSDL 1.4 from energistics.
-    
+
         Args:
             service_url (str): url giving the location of the Store
             username (str): username on the service
             password (str): password on the service
             agent_name (str): User-Agent name to pass in header
             verify (bool|str): Whether to verify TLS certificates, or path to a cacerts file
+            validate (bool): If True parse replies into validated pyxb objects, if False
+                             use the much faster lxml parse to WitsmlElement objects
+            cache_maxsize (int): Max number of GetFromStore replies to keep in the
+                                 in-memory lru cache, default 0 keeps caching off
+                                 since witsml stores serve growing objects
+            cache_ttl (float): Seconds a cached reply stays valid, None means no expiry
         '''
-    
+
         self.soap_client = simple_client(service_url,
                                          username,
                                          password,
                                          agent_name,
                                          verify)
-    
-    def get_bhaRuns(self, 
-                    q_bha: witsml.obj_bhaRun,
-                    returnElements: str='id-only') -> witsml.bhaRuns:
+
+        self.validate = validate
+        self.cache_maxsize = cache_maxsize
+        self.cache_ttl = cache_ttl
+        self._cache = OrderedDict()
+        self._inflight = {}
+        # Guards the cache and inflight bookkeeping, never held during a roundtrip
+        self._lock = threading.Lock()
+
+    def clear_cache(self):
+        '''Drop all cached GetFromStore replies'''
+        with self._lock:
+            self._cache.clear()
+
+    def _get_from_store(self, obj_type: str, query_xml: str, returnElements: str):
+        '''Run WMLS_GetFromStore and parse the reply, with an lru cache
+
+        Identical queries are frequent in analytics pipelines, so parsed
+        replies are cached on (obj_type, query_xml, returnElements) and
+        repeat calls skip both the roundtrip and the parse.
+        '''
+        try:
+            options_in = _OPTIONS_IN[returnElements]
+        except KeyError:
+            # Fail before the roundtrip instead of on a server side rejection
+            raise ValueError(f'returnElements must be one of {list(_OPTIONS_IN)}, '
+                             f'got {returnElements!r}') from None
+
+        key = (obj_type, query_xml, returnElements)
+
+        with self._lock:
+            if self.cache_maxsize and key in self._cache:
+                cached_at, parsed = self._cache[key]
+                if self.cache_ttl is None or time.monotonic() - cached_at < self.cache_ttl:
+                    self._cache.move_to_end(key)
+                    return parsed
+                del self._cache[key]
+
+            # Coalesce identical in-flight queries, later callers wait on the
+            # first roundtrip instead of launching their own
+            future = self._inflight.get(key)
+            if future is None:
+                future = concurrent.futures.Future()
+                self._inflight[key] = future
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            return future.result()
+
+        try:
+            reply = self.soap_client.service.WMLS_GetFromStore(obj_type,
+                                                               query_xml,
+                                                               OptionsIn=options_in
+                                                              )
+
+            if isinstance(reply, tuple):
+                # With faults=False suds returns (http status, reply)
+                _, reply = reply
+
+            parsed = _parse_reply(reply, self.validate)
+        except BaseException as err:
+            future.set_exception(err)
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+        future.set_result(parsed)
+
+        if self.cache_maxsize:
+            with self._lock:
+                self._cache[key] = (time.monotonic(), parsed)
+                while len(self._cache) > self.cache_maxsize:
+                    self._cache.popitem(last=False)
+
+        return parsed
+
+    def _get(self, obj_type: str, q_obj, returnElements: str):
+        '''Generic GetFromStore for any of the supported object types'''
+        if obj_type not in _wrappers():
+            # Fail before the roundtrip instead of on a server side rejection
+            raise ValueError(f'obj_type must be one of {list(_wrappers())}, '
+                             f'got {obj_type!r}')
+
+        return self._get_from_store(obj_type,
+                                    _build_query_xml(q_obj, obj_type),
+                                    returnElements)
+
+    def get_many(self, obj_type: str, queries, returnElements: str='id-only',
+                 max_workers: int=8) -> list:
+        '''Get many objects of one type from a witsml store server concurrently
+
+        Each query is a blocking soap roundtrip, so fetching for example all
+        logs across wellbores one by one is latency bound. This fires the
+        queries on a thread pool over the shared keep-alive session, the gil
+        is released during network io so the calls overlap.
+
+        Args:
+            obj_type (str): The singular witsml type, one of [bhaRun, log, mudLog,
+                            trajectory, wellbore, tubular, fluidsReport, drillReport,
+                            wbGeometry, formationMarker]
+            queries: An iterable of query objects of the given type
+            returnElements (str): String describing data to get on of [all, id-only, header-only, data-only, station-location-only
+                                                                       latest-change-only, requested]
+            max_workers (int): Number of concurrent requests, the connection pool
+                               is grown to match
+
+        Returns:
+            list: The parsed replies in the same order as the queries
+
+        Raises:
+            StoreException: If the soap server replies with an error
+            pyxb.exception: If a reply is empty or the document fails to validate a pyxb exception is raised
+        '''
+        if obj_type not in _wrappers():
+            raise ValueError(f'obj_type must be one of {list(_wrappers())}, '
+                             f'got {obj_type!r}')
+
+        transport = self.soap_client.options.transport
+        if isinstance(transport, RequestsTransport):
+            transport.ensure_pool_size(max_workers)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(lambda q_obj: self._get(obj_type, q_obj, returnElements),
+                                 queries))
+
+    def close(self):
+        '''Close the underlying http session and its pooled connections'''
+        self.soap_client.options.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get_bhaRuns(self,
+                    q_bha: 'witsml.obj_bhaRun',
+                    returnElements: str='id-only') -> 'witsml.bhaRuns':
         '''Get bhaRuns from a witsml store server
     
         The default is only to return id-only, change to all when you know what bhaRun to get.
@@ -117,21 +472,12 @@ class StoreClient:
             pyxb.exception: If the reply is empty or the document fails to validate a pyxb exception is raised
         '''
     
-        q_bhas = witsml.bhaRuns(version=witsml.__version__)
-    
-        q_bhas.append(q_bha)
-    
-        reply_bhas = self.soap_client.service.WMLS_GetFromStore('bhaRun',
-                                                                q_bhas.toxml(),
-                                                                OptionsIn=f'returnElements={returnElements}'
-                                                               )
-    
-        return _parse_reply(reply_bhas)
+        return self._get('bhaRun', q_bha, returnElements)
 
 
     def get_logs(self, 
-                 q_log: witsml.obj_log,
-                 returnElements: str='id-only') -> witsml.logs:
+                 q_log: 'witsml.obj_log',
+                 returnElements: str='id-only') -> 'witsml.logs':
         '''Get logs from a witsml store server
     
         The default is to return id-only, change to all when you know what log to get.
@@ -150,20 +496,11 @@ class StoreClient:
             pyxb.exception: If the reply is empty or the document fails to validate a pyxb exception is raised
         '''
     
-        q_logs = witsml.logs(version=witsml.__version__)
-    
-        q_logs.append(q_log)
-    
-        reply_logs = self.soap_client.service.WMLS_GetFromStore('log',
-                                                                q_logs.toxml(),
-                                                                OptionsIn=f'returnElements={returnElements}'
-                                                               )
-
-        return _parse_reply(reply_logs)
+        return self._get('log', q_log, returnElements)
 
     def get_mudLogs(self, 
-                    q_mudlog: witsml.obj_mudLog,
-                    returnElements: str='id-only') -> witsml.mudLogs:
+                    q_mudlog: 'witsml.obj_mudLog',
+                    returnElements: str='id-only') -> 'witsml.mudLogs':
         '''Get mudLogs from a witsml store server
     
         The default is only to return id-only, change to all when you know what mudLog to get.
@@ -182,20 +519,11 @@ class StoreClient:
             pyxb.exception: If the reply is empty or the document fails to validate a pyxb exception is raised
         '''
     
-        q_mudlogs = witsml.mudLogs(version=witsml.__version__)
-    
-        q_mudlogs.append(q_mudlog)
-    
-        reply_mudlogs = self.soap_client.service.WMLS_GetFromStore('mudLog',
-                                                                   q_mudlogs.toxml(),
-                                                                   OptionsIn=f'returnElements={returnElements}'
-                                                                  )
-    
-        return _parse_reply(reply_mudlogs)
+        return self._get('mudLog', q_mudlog, returnElements)
 
     def get_trajectorys(self, 
-                        q_traj: witsml.obj_trajectory,
-                        returnElements: str='id-only') -> witsml.trajectorys:
+                        q_traj: 'witsml.obj_trajectory',
+                        returnElements: str='id-only') -> 'witsml.trajectorys':
         '''Get trajectorys from a witsml store server
     
         The default is only to return id-only, change to all when you know what trajectory to get.
@@ -213,20 +541,11 @@ class StoreClient:
             pyxb.exception: If the reply is empty or the document fails to validate a pyxb exception is raised
         '''
     
-        q_trajs = witsml.trajectorys(version=witsml.__version__)
-    
-        q_trajs.append(q_traj)
-    
-        reply_traj = self.soap_client.service.WMLS_GetFromStore('trajectory',
-                                                                q_trajs.toxml(),
-                                                                OptionsIn=f'returnElements={returnElements}'
-                                                               )
-    
-        return _parse_reply(reply_traj)
+        return self._get('trajectory', q_traj, returnElements)
 
     def get_wellbores(self, 
-                      q_wellbore: witsml.obj_wellbore,
-                      returnElements: str='id-only') -> witsml.wellbores:
+                      q_wellbore: 'witsml.obj_wellbore',
+                      returnElements: str='id-only') -> 'witsml.wellbores':
         '''Get wellbores from a witsml store server
     
         The default is only to return id-only, change to all when you know what wellbore to get.
@@ -244,20 +563,11 @@ class StoreClient:
             pyxb.exception: If the reply is empty or the document fails to validate a pyxb exception is raised
         '''
     
-        q_wellbores = witsml.wellbores(version=witsml.__version__)
-    
-        q_wellbores.append(q_wellbore)
-    
-        reply_wellbores = self.soap_client.service.WMLS_GetFromStore('wellbore',
-                                                                     q_wellbores.toxml(),
-                                                                     OptionsIn=f'returnElements={returnElements}'
-                                                                    )
-    
-        return _parse_reply(reply_wellbores)
+        return self._get('wellbore', q_wellbore, returnElements)
 
     def get_tubulars(self,
-                        q_tubular: witsml.obj_tubular,
-                        returnElements: str = 'id-only') -> witsml.tubulars:
+                        q_tubular: 'witsml.obj_tubular',
+                        returnElements: str = 'id-only') -> 'witsml.tubulars':
         '''Get tubulars from a witsml store server
 
         The default is only to return id-only, change to all when you know what tubular to get.
@@ -275,20 +585,11 @@ class StoreClient:
             pyxb.exception: If the reply is empty or the document fails to validate a pyxb exception is raised
         '''
 
-        q_tubulars = witsml.tubulars(version=witsml.__version__)
-
-        q_tubulars.append(q_tubular)
-
-        reply_tubular = self.soap_client.service.WMLS_GetFromStore('tubular',
-                                                                q_tubulars.toxml(),
-                                                                OptionsIn=f'returnElements={returnElements}'
-                                                                )
-
-        return _parse_reply(reply_tubular)
+        return self._get('tubular', q_tubular, returnElements)
 
     def get_fluidsReports(self,
-                        q_fluidsReport: witsml.obj_fluidsReport,
-                        returnElements: str = 'id-only') -> witsml.fluidsReports:
+                        q_fluidsReport: 'witsml.obj_fluidsReport',
+                        returnElements: str = 'id-only') -> 'witsml.fluidsReports':
         '''Get fluidsReports from a witsml store server
 
         The default is only to return id-only, change to all when you know what fluidsReport to get.
@@ -306,20 +607,11 @@ class StoreClient:
             pyxb.exception: If the reply is empty or the document fails to validate a pyxb exception is raised
         '''
 
-        q_fluidsReports = witsml.fluidsReports(version=witsml.__version__)
-
-        q_fluidsReports.append(q_fluidsReport)
-
-        reply_fluidsReport = self.soap_client.service.WMLS_GetFromStore('fluidsReport',
-                                                                q_fluidsReports.toxml(),
-                                                                OptionsIn=f'returnElements={returnElements}'
-                                                                )
-
-        return _parse_reply(reply_fluidsReport)
+        return self._get('fluidsReport', q_fluidsReport, returnElements)
 
     def get_drillReports(self,
-                        q_drillReport: witsml.obj_drillReport,
-                        returnElements: str = 'id-only') -> witsml.drillReports:
+                        q_drillReport: 'witsml.obj_drillReport',
+                        returnElements: str = 'id-only') -> 'witsml.drillReports':
         '''Get drillReports from a witsml store server
 
         The default is only to return id-only, change to all when you know what drillReport to get.
@@ -337,20 +629,11 @@ class StoreClient:
             pyxb.exception: If the reply is empty or the document fails to validate a pyxb exception is raised
         '''
 
-        q_drillReports = witsml.drillReports(version=witsml.__version__)
-
-        q_drillReports.append(q_drillReport)
-
-        reply_drillReport = self.soap_client.service.WMLS_GetFromStore('drillReport',
-                                                                q_drillReports.toxml(),
-                                                                OptionsIn=f'returnElements={returnElements}'
-                                                                )
-
-        return _parse_reply(reply_drillReport)
+        return self._get('drillReport', q_drillReport, returnElements)
 
     def get_wbGeometrys(self,
-                        q_wbGeometry: witsml.obj_wbGeometry,
-                        returnElements: str = 'id-only') -> witsml.wbGeometrys:
+                        q_wbGeometry: 'witsml.obj_wbGeometry',
+                        returnElements: str = 'id-only') -> 'witsml.wbGeometrys':
         '''Get wbGeometrys from a witsml store server
 
         The default is only to return id-only, change to all when you know what wbGeometry to get.
@@ -368,20 +651,11 @@ class StoreClient:
             pyxb.exception: If the reply is empty or the document fails to validate a pyxb exception is raised
         '''
 
-        q_wbGeometrys = witsml.wbGeometrys(version=witsml.__version__)
-
-        q_wbGeometrys.append(q_wbGeometry)
-
-        reply_wbGeometry = self.soap_client.service.WMLS_GetFromStore('wbGeometry',
-                                                                q_wbGeometrys.toxml(),
-                                                                OptionsIn=f'returnElements={returnElements}'
-                                                                )
-
-        return _parse_reply(reply_wbGeometry)
+        return self._get('wbGeometry', q_wbGeometry, returnElements)
 
     def get_formationMarkers(self,
-                        q_formationMarker: witsml.obj_formationMarker,
-                        returnElements: str = 'id-only') -> witsml.formationMarkers:
+                        q_formationMarker: 'witsml.obj_formationMarker',
+                        returnElements: str = 'id-only') -> 'witsml.formationMarkers':
         '''Get formationMarkers from a witsml store server
 
         The default is only to return id-only, change to all when you know what formationMarker to get.
@@ -399,13 +673,4 @@ class StoreClient:
             pyxb.exception: If the reply is empty or the document fails to validate a pyxb exception is raised
         '''
 
-        q_formationMarkers = witsml.formationMarkers(version=witsml.__version__)
-
-        q_formationMarkers.append(q_formationMarker)
-
-        reply_formationMarker = self.soap_client.service.WMLS_GetFromStore('formationMarker',
-                                                                q_formationMarkers.toxml(),
-                                                                OptionsIn=f'returnElements={returnElements}'
-                                                                )
-
-        return _parse_reply(reply_formationMarker)
+        return self._get('formationMarker', q_formationMarker, returnElements)
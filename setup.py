@@ -14,8 +14,8 @@ setup(
                    },
       install_requires=['suds-py3==1.4.0.0',
                         'PyXB==1.2.6',
-
-                       ], 
+                        'lxml>=4.0',
+                       ],
       tests_require=[
                      'pytest>=3.0'
                     ]
@@ -0,0 +1,260 @@
+import threading
+import time
+
+import pytest
+
+from komle import soap_client
+from komle.soap_client import StoreClient, _is_empty_query, _parse_reply_lxml
+
+LOG_REPLY = '''<logs xmlns="http://www.witsml.org/schemas/1series" version="1.4.1.1">
+    <log uidWell="W-12" uidWellbore="B-01" uid="L-99">
+        <nameWell>Unit 12</nameWell>
+        <name>GR</name>
+        <logCurveInfo uid="lci-1">
+            <mnemonic>TIME</mnemonic>
+            <unit>s</unit>
+        </logCurveInfo>
+        <logCurveInfo uid="lci-2">
+            <mnemonic>GS_GR</mnemonic>
+            <unit>gAPI</unit>
+        </logCurveInfo>
+        <commonData>
+            <extensionNameValue uid="ext-1">
+                <name>bitDepth</name>
+                <value uom="m">1234.5</value>
+            </extensionNameValue>
+        </commonData>
+    </log>
+</logs>'''
+
+
+class StubReply:
+
+    def __init__(self, xml_out, result=1):
+        self.Result = result
+        self.XMLout = xml_out
+        self.SuppMsgOut = ''
+
+
+def stub_store_client(xml_out=LOG_REPLY, delay=0, **store_kwargs):
+    '''A StoreClient wired to a fake soap service instead of a witsml server
+
+    The fake WMLS_GetFromStore records every call, so tests can assert on
+    how many roundtrips were made.
+    '''
+
+    client = StoreClient.__new__(StoreClient)
+
+    client.validate = store_kwargs.pop('validate', False)
+    client.cache_maxsize = store_kwargs.pop('cache_maxsize', 0)
+    client.cache_ttl = store_kwargs.pop('cache_ttl', None)
+    client._cache = soap_client.OrderedDict()
+    client._inflight = {}
+    client._lock = threading.Lock()
+
+    calls = []
+    call_lock = threading.Lock()
+
+    class StubService:
+
+        def WMLS_GetFromStore(self, wml_type, query_xml, OptionsIn):
+            with call_lock:
+                calls.append((wml_type, query_xml, OptionsIn))
+            if delay:
+                time.sleep(delay)
+            return StubReply(xml_out)
+
+    class StubSoapClient:
+        service = StubService()
+
+    client.soap_client = StubSoapClient()
+
+    return client, calls
+
+
+def test_parse_reply_single_and_repeated_children():
+
+    root = _parse_reply_lxml(LOG_REPLY)
+
+    # A child that occurs once comes back singular
+    log = root.log
+    assert log._tag == 'log'
+    assert log.name._text == 'GR'
+    assert log.nameWell._text == 'Unit 12'
+
+    # A repeated child comes back as a list
+    curves = log.logCurveInfo
+    assert isinstance(curves, list)
+    assert [c.mnemonic._text for c in curves] == ['TIME', 'GS_GR']
+
+
+def test_parse_reply_attributes():
+
+    root = _parse_reply_lxml(LOG_REPLY)
+
+    assert root.version == '1.4.1.1'
+    assert root.log.uid == 'L-99'
+    assert root.log.uidWell == 'W-12'
+    assert root.log._attrib == {'uidWell': 'W-12', 'uidWellbore': 'B-01', 'uid': 'L-99'}
+    assert root.log.logCurveInfo[1].uid == 'lci-2'
+
+
+def test_parse_reply_element_named_like_the_api():
+
+    # value is both a witsml element name and a natural accessor name,
+    # the underscore api keeps the element reachable
+    ext = _parse_reply_lxml(LOG_REPLY).log.commonData.extensionNameValue
+    assert ext.value._text == '1234.5'
+    assert ext.value.uom == 'm'
+
+
+def test_parse_reply_missing_child_raises():
+
+    root = _parse_reply_lxml(LOG_REPLY)
+
+    with pytest.raises(AttributeError):
+        root.log.noSuchElement
+
+
+def test_parse_reply_accepts_bytes_and_file():
+
+    from io import BytesIO
+
+    assert _parse_reply_lxml(LOG_REPLY.encode('utf-8')).log.name._text == 'GR'
+    assert _parse_reply_lxml(BytesIO(LOG_REPLY.encode('utf-8'))).log.name._text == 'GR'
+
+
+def test_is_empty_query():
+
+    from komle.bindings.v1411.read import witsml
+
+    assert _is_empty_query(witsml.obj_log())
+    assert not _is_empty_query(witsml.obj_log(name='GR'))
+    assert not _is_empty_query(witsml.obj_log(uid='L-99'))
+
+
+def test_is_empty_query_sees_plural_appends():
+
+    from komle.bindings.v1411.read import witsml
+
+    # Appended plural content is invisible to orderedContent but must
+    # still make the query non-empty
+    q_log = witsml.obj_log()
+    q_log.logCurveInfo.append(witsml.cs_logCurveInfo(mnemonic='GS_GR'))
+
+    assert not q_log.orderedContent()
+    assert not _is_empty_query(q_log)
+
+
+def test_cache_hit_skips_the_roundtrip():
+
+    client, calls = stub_store_client(cache_maxsize=4)
+
+    first = client._get_from_store('log', '<q/>', 'id-only')
+    second = client._get_from_store('log', '<q/>', 'id-only')
+
+    assert len(calls) == 1
+    assert second is first
+
+    # A different key is its own roundtrip
+    client._get_from_store('log', '<q/>', 'all')
+    assert len(calls) == 2
+
+
+def test_cache_off_by_default():
+
+    client, calls = stub_store_client()
+
+    client._get_from_store('log', '<q/>', 'id-only')
+    client._get_from_store('log', '<q/>', 'id-only')
+
+    assert len(calls) == 2
+
+
+def test_cache_ttl_expiry(monkeypatch):
+
+    client, calls = stub_store_client(cache_maxsize=4, cache_ttl=10)
+
+    now = [1000.0]
+    monkeypatch.setattr(soap_client.time, 'monotonic', lambda: now[0])
+
+    client._get_from_store('log', '<q/>', 'id-only')
+    now[0] += 5
+    client._get_from_store('log', '<q/>', 'id-only')
+    assert len(calls) == 1
+
+    now[0] += 10
+    client._get_from_store('log', '<q/>', 'id-only')
+    assert len(calls) == 2
+
+
+def test_cache_evicts_least_recently_used():
+
+    client, calls = stub_store_client(cache_maxsize=2)
+
+    client._get_from_store('log', '<q1/>', 'id-only')
+    client._get_from_store('log', '<q2/>', 'id-only')
+    # Touch q1 so q2 is the one to go when q3 comes in
+    client._get_from_store('log', '<q1/>', 'id-only')
+    client._get_from_store('log', '<q3/>', 'id-only')
+    assert len(calls) == 3
+
+    client._get_from_store('log', '<q1/>', 'id-only')
+    assert len(calls) == 3
+
+    client._get_from_store('log', '<q2/>', 'id-only')
+    assert len(calls) == 4
+
+
+def test_clear_cache():
+
+    client, calls = stub_store_client(cache_maxsize=4)
+
+    client._get_from_store('log', '<q/>', 'id-only')
+    client.clear_cache()
+    client._get_from_store('log', '<q/>', 'id-only')
+
+    assert len(calls) == 2
+
+
+def test_inflight_queries_are_coalesced():
+
+    client, calls = stub_store_client(delay=0.1)
+
+    results = []
+
+    def worker():
+        results.append(client._get_from_store('log', '<q/>', 'id-only'))
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert not client._inflight
+
+
+def test_store_exception_on_error_reply():
+
+    client, calls = stub_store_client()
+    client.soap_client.service.WMLS_GetFromStore = \
+        lambda *args, **kwargs: StubReply('', result=-401)
+
+    with pytest.raises(soap_client.StoreException):
+        client._get_from_store('log', '<q/>', 'id-only')
+
+    # A failed roundtrip must not leave the key stuck as in flight
+    assert not client._inflight
+
+
+def test_bad_return_elements_fails_before_the_roundtrip():
+
+    client, calls = stub_store_client()
+
+    with pytest.raises(ValueError, match='returnElements'):
+        client._get_from_store('log', '<q/>', 'everything')
+
+    assert not calls